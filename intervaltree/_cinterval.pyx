@@ -0,0 +1,260 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+intervaltree: A mutable, self-balancing interval tree for Python 2 and 3.
+Queries may be by point, by range overlap, or by range envelopment.
+
+Optional Cython-accelerated Interval classes with typed C endpoint
+fields. These are opt-in specializations for numeric workloads: the
+pure-Python Interval remains the default, and this module only exists
+when the package was built with Cython available.
+
+Copyright 2013-2018 Chaim Leib Halbert
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import cython
+
+from libc.stdint cimport int64_t
+
+
+cdef int _cmp_data(object a, object b) except? -2:
+    # Same data tiebreak as Interval._cmp_data()
+    try:
+        if a == b:
+            return 0
+        return -1 if a < b else 1
+    except TypeError:
+        s = type(a).__name__
+        o = type(b).__name__
+        if s == o:
+            return 0
+        return -1 if s < o else 1
+
+
+@cython.final
+cdef class IntervalI64:
+    """
+    An Interval whose begin and end are stored as C int64 fields.
+    Mirrors the Interval API for the hot-path methods; overlaps_range
+    and contains_point run entirely on C integers.
+    """
+    cdef readonly int64_t begin
+    cdef readonly int64_t end
+    cdef readonly object data
+
+    def __cinit__(self, int64_t begin, int64_t end, data=None):
+        self.begin = begin
+        self.end = end
+        self.data = data
+
+    cpdef bint overlaps_range(self, int64_t begin, int64_t end):
+        """
+        Whether the interval overlaps the given range.
+        """
+        return begin < self.end and end > self.begin
+
+    cpdef bint overlaps_range_branchless(self, int64_t begin, int64_t end) nogil:
+        """
+        Branchless form of overlaps_range. Evaluates both comparisons as
+        sign bits and ORs them, so random query workloads pay no branch
+        mispredictions in a tight leaf scan. Endpoint differences must
+        not overflow int64.
+        """
+        return ((self.end - begin - 1) | (end - self.begin - 1)) >= 0
+
+    cpdef bint contains_point(self, int64_t p):
+        """
+        Whether the Interval contains p.
+        """
+        return self.begin <= p and p < self.end
+
+    def overlaps(self, begin, end=None):
+        """
+        Whether the interval overlaps the given point, range or
+        Interval.
+        """
+        if end is not None:
+            return self.overlaps_range(begin, end)
+        if hasattr(begin, 'begin'):
+            return self.overlaps_range(begin.begin, begin.end)
+        return self.contains_point(begin)
+
+    def overlap_size(self, begin, end=None):
+        """
+        Return the overlap size between two intervals or a range,
+        0 if no overlap is found.
+        """
+        cdef int64_t b, e, i0, i1
+        if end is None:
+            b = begin.begin
+            e = begin.end
+        else:
+            b = begin
+            e = end
+        i0 = self.begin if self.begin > b else b
+        i1 = self.end if self.end < e else e
+        return i1 - i0 if i1 > i0 else 0
+
+    def is_null(self):
+        """
+        Whether this equals the null interval.
+        """
+        return self.begin >= self.end
+
+    def length(self):
+        """
+        The distance covered by this Interval.
+        """
+        if self.begin >= self.end:
+            return 0
+        return self.end - self.begin
+
+    def __hash__(self):
+        return hash((self.begin, self.end))
+
+    def __richcmp__(self, other, int op):
+        cdef int c
+        if self.begin != other.begin:
+            c = -1 if self.begin < other.begin else 1
+        elif self.end != other.end:
+            c = -1 if self.end < other.end else 1
+        else:
+            c = _cmp_data(self.data, getattr(other, 'data', None))
+        if op == 0:  # <
+            return c < 0
+        elif op == 1:  # <=
+            return c <= 0
+        elif op == 2:  # ==
+            return c == 0
+        elif op == 3:  # !=
+            return c != 0
+        elif op == 4:  # >
+            return c > 0
+        else:  # >=
+            return c >= 0
+
+    def __repr__(self):
+        if self.data is None:
+            return "IntervalI64({0}, {1})".format(self.begin, self.end)
+        return "IntervalI64({0}, {1}, {2})".format(
+            self.begin, self.end, repr(self.data))
+
+    __str__ = __repr__
+
+    def __reduce__(self):
+        return IntervalI64, (self.begin, self.end, self.data)
+
+
+@cython.final
+cdef class IntervalF64:
+    """
+    An Interval whose begin and end are stored as C double fields.
+    Mirrors the Interval API for the hot-path methods; overlaps_range
+    and contains_point run entirely on C doubles.
+    """
+    cdef readonly double begin
+    cdef readonly double end
+    cdef readonly object data
+
+    def __cinit__(self, double begin, double end, data=None):
+        self.begin = begin
+        self.end = end
+        self.data = data
+
+    cpdef bint overlaps_range(self, double begin, double end):
+        """
+        Whether the interval overlaps the given range.
+        """
+        return begin < self.end and end > self.begin
+
+    cpdef bint contains_point(self, double p):
+        """
+        Whether the Interval contains p.
+        """
+        return self.begin <= p and p < self.end
+
+    def overlaps(self, begin, end=None):
+        """
+        Whether the interval overlaps the given point, range or
+        Interval.
+        """
+        if end is not None:
+            return self.overlaps_range(begin, end)
+        if hasattr(begin, 'begin'):
+            return self.overlaps_range(begin.begin, begin.end)
+        return self.contains_point(begin)
+
+    def overlap_size(self, begin, end=None):
+        """
+        Return the overlap size between two intervals or a range,
+        0 if no overlap is found.
+        """
+        cdef double b, e, i0, i1
+        if end is None:
+            b = begin.begin
+            e = begin.end
+        else:
+            b = begin
+            e = end
+        i0 = self.begin if self.begin > b else b
+        i1 = self.end if self.end < e else e
+        return i1 - i0 if i1 > i0 else 0
+
+    def is_null(self):
+        """
+        Whether this equals the null interval.
+        """
+        return self.begin >= self.end
+
+    def length(self):
+        """
+        The distance covered by this Interval.
+        """
+        if self.begin >= self.end:
+            return 0
+        return self.end - self.begin
+
+    def __hash__(self):
+        return hash((self.begin, self.end))
+
+    def __richcmp__(self, other, int op):
+        cdef int c
+        if self.begin != other.begin:
+            c = -1 if self.begin < other.begin else 1
+        elif self.end != other.end:
+            c = -1 if self.end < other.end else 1
+        else:
+            c = _cmp_data(self.data, getattr(other, 'data', None))
+        if op == 0:  # <
+            return c < 0
+        elif op == 1:  # <=
+            return c <= 0
+        elif op == 2:  # ==
+            return c == 0
+        elif op == 3:  # !=
+            return c != 0
+        elif op == 4:  # >
+            return c > 0
+        else:  # >=
+            return c >= 0
+
+    def __repr__(self):
+        if self.data is None:
+            return "IntervalF64({0}, {1})".format(self.begin, self.end)
+        return "IntervalF64({0}, {1}, {2})".format(
+            self.begin, self.end, repr(self.data))
+
+    __str__ = __repr__
+
+    def __reduce__(self):
+        return IntervalF64, (self.begin, self.end, self.data)
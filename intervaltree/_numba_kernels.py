@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+intervaltree: A mutable, self-balancing interval tree for Python 2 and 3.
+Queries may be by point, by range overlap, or by range envelopment.
+
+Optional numba-compiled batch kernels. These evaluate Interval
+predicates over parallel endpoint arrays (structure-of-arrays layout)
+in one call, avoiding per-interval Python overhead. When numba is not
+installed the kernels still work, as plain Python loops, and a warning
+is issued once.
+
+Copyright 2013-2018 Chaim Leib Halbert
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import warnings
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; kernels fall back to Python loops
+    njit = None
+    prange = range
+
+_warned_missing_numba = False
+
+
+def _maybe_compile(py_func):
+    """
+    Compiles py_func with numba when available; otherwise returns a
+    wrapper that warns once about the pure-Python fallback.
+    :param py_func: kernel written in numba-compilable style
+    :return: compiled or wrapped kernel
+    """
+    if njit is not None:
+        return njit(parallel=True, fastmath=True, cache=True)(py_func)
+
+    def wrapper(*args):
+        global _warned_missing_numba
+        if not _warned_missing_numba:
+            warnings.warn(
+                "numba is not installed; intervaltree batch kernels will "
+                "run as pure Python loops"
+            )
+            _warned_missing_numba = True
+        return py_func(*args)
+    wrapper.__name__ = py_func.__name__
+    wrapper.__doc__ = py_func.__doc__
+    return wrapper
+
+
+def overlap_sizes(begins, ends, q_begin, q_end, out):
+    """
+    Batch version of Interval.overlap_size() against one query range.
+    Writes the overlap size of each interval into out, 0 where there is
+    no overlap.
+    :param begins: ndarray of interval begins
+    :param ends: ndarray of interval ends, parallel to begins
+    :param q_begin: beginning point of the query range
+    :param q_end: end point of the query range
+    :param out: ndarray to write the sizes into, parallel to begins
+    :return: out
+    :rtype: ndarray
+    """
+    for i in prange(begins.shape[0]):
+        b = begins[i]
+        e = ends[i]
+        if q_begin < e and q_end > b:
+            lo = b if b > q_begin else q_begin
+            hi = e if e < q_end else q_end
+            out[i] = hi - lo
+        else:
+            out[i] = 0
+    return out
+
+
+def contains_points(begins, ends, p, out):
+    """
+    Batch version of Interval.contains_point() against one point.
+    Writes True into out where the interval contains p.
+    :param begins: ndarray of interval begins
+    :param ends: ndarray of interval ends, parallel to begins
+    :param p: the point
+    :param out: bool ndarray to write the mask into, parallel to begins
+    :return: out
+    :rtype: ndarray of bool
+    """
+    for i in prange(begins.shape[0]):
+        out[i] = begins[i] <= p and p < ends[i]
+    return out
+
+
+overlap_sizes = _maybe_compile(overlap_sizes)
+contains_points = _maybe_compile(contains_points)
@@ -0,0 +1,202 @@
+/*
+ * intervaltree: A mutable, self-balancing interval tree for Python 2 and 3.
+ * Queries may be by point, by range overlap, or by range envelopment.
+ *
+ * Optional SIMD range-filter kernel. Evaluates the Interval.overlaps()
+ * range test over parallel int64 endpoint arrays (structure-of-arrays
+ * layout), one byte of output mask per interval. On x86 the best
+ * available implementation is chosen at import time: AVX-512 (8
+ * intervals per iteration, mask registers), AVX2 (4 per iteration), or
+ * a scalar loop.
+ *
+ * Copyright 2013-2018 Chaim Leib Halbert
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <stddef.h>
+
+/* Function multi-versioning via target attributes plus
+ * __builtin_cpu_supports() needs GCC or Clang on x86; elsewhere only the
+ * scalar loop is compiled. */
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#define HAVE_X86_DISPATCH 1
+#include <immintrin.h>
+#endif
+
+typedef void (*range_filter_fn)(const int64_t *, const int64_t *, size_t,
+                                int64_t, int64_t, uint8_t *);
+
+static void
+range_filter_i64_scalar(const int64_t *begins, const int64_t *ends, size_t n,
+                        int64_t qb, int64_t qe, uint8_t *out)
+{
+    size_t i;
+    for (i = 0; i < n; i++) {
+        out[i] = (uint8_t)((qb < ends[i]) & (qe > begins[i]));
+    }
+}
+
+#if defined(HAVE_X86_DISPATCH)
+__attribute__((target("avx2")))
+static void
+range_filter_i64_avx2(const int64_t *begins, const int64_t *ends, size_t n,
+                      int64_t qb, int64_t qe, uint8_t *out)
+{
+    const __m256i qb_v = _mm256_set1_epi64x(qb);
+    const __m256i qe_v = _mm256_set1_epi64x(qe);
+    size_t i = 0;
+
+    if (n < 4) {
+        range_filter_i64_scalar(begins, ends, n, qb, qe, out);
+        return;
+    }
+    while (i < n) {
+        int m, k;
+        __m256i b_v, e_v, hit;
+        /* Overlapped tail: re-process the last full vector instead of
+         * falling back to a scalar loop. Mask bytes are idempotent. */
+        if (i + 4 > n)
+            i = n - 4;
+        b_v = _mm256_loadu_si256((const __m256i *)(begins + i));
+        e_v = _mm256_loadu_si256((const __m256i *)(ends + i));
+        hit = _mm256_and_si256(_mm256_cmpgt_epi64(e_v, qb_v),   /* qb < end */
+                               _mm256_cmpgt_epi64(qe_v, b_v));  /* qe > begin */
+        m = _mm256_movemask_pd(_mm256_castsi256_pd(hit));
+        for (k = 0; k < 4; k++) {
+            out[i + k] = (uint8_t)((m >> k) & 1);
+        }
+        i += 4;
+    }
+}
+
+__attribute__((target("avx512f")))
+static void
+range_filter_i64_avx512(const int64_t *begins, const int64_t *ends, size_t n,
+                        int64_t qb, int64_t qe, uint8_t *out)
+{
+    const __m512i qb_v = _mm512_set1_epi64(qb);
+    const __m512i qe_v = _mm512_set1_epi64(qe);
+    size_t i = 0;
+
+    while (i + 8 <= n) {
+        int k;
+        __m512i b_v = _mm512_loadu_si512((const void *)(begins + i));
+        __m512i e_v = _mm512_loadu_si512((const void *)(ends + i));
+        __mmask8 m = _mm512_cmpgt_epi64_mask(e_v, qb_v)    /* qb < end */
+                   & _mm512_cmpgt_epi64_mask(qe_v, b_v);   /* qe > begin */
+        for (k = 0; k < 8; k++) {
+            out[i + k] = (uint8_t)((m >> k) & 1);
+        }
+        i += 8;
+    }
+    if (i < n) {
+        /* Masked loads and compares handle the tail natively instead of
+         * an overlapped re-read; lanes past n stay zero. */
+        size_t k;
+        __mmask8 lanes = (__mmask8)((1u << (n - i)) - 1);
+        __m512i b_v = _mm512_maskz_loadu_epi64(lanes, (const void *)(begins + i));
+        __m512i e_v = _mm512_maskz_loadu_epi64(lanes, (const void *)(ends + i));
+        __mmask8 m = _mm512_mask_cmpgt_epi64_mask(lanes, e_v, qb_v)
+                   & _mm512_mask_cmpgt_epi64_mask(lanes, qe_v, b_v);
+        for (k = 0; i + k < n; k++) {
+            out[i + k] = (uint8_t)((m >> k) & 1);
+        }
+    }
+}
+#endif
+
+static range_filter_fn range_filter_impl = range_filter_i64_scalar;
+
+static void
+range_filter_init(void)
+{
+#if defined(HAVE_X86_DISPATCH)
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("avx512f"))
+        range_filter_impl = range_filter_i64_avx512;
+    else if (__builtin_cpu_supports("avx2"))
+        range_filter_impl = range_filter_i64_avx2;
+#endif
+}
+
+static void
+range_filter_i64(const int64_t *begins, const int64_t *ends, size_t n,
+                 int64_t qb, int64_t qe, uint8_t *out)
+{
+    range_filter_impl(begins, ends, n, qb, qe, out);
+}
+
+static PyObject *
+py_range_filter_i64(PyObject *self, PyObject *args)
+{
+    Py_buffer begins, ends;
+    long long qb, qe;
+    PyObject *result;
+    Py_ssize_t n;
+
+    if (!PyArg_ParseTuple(args, "y*y*LL:range_filter_i64",
+                          &begins, &ends, &qb, &qe))
+        return NULL;
+    if (begins.len != ends.len) {
+        PyErr_SetString(PyExc_ValueError,
+                        "begins and ends must have the same length");
+        goto error;
+    }
+    if (begins.len % (Py_ssize_t)sizeof(int64_t) != 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "begins and ends must be contiguous int64 buffers");
+        goto error;
+    }
+    n = begins.len / (Py_ssize_t)sizeof(int64_t);
+    result = PyBytes_FromStringAndSize(NULL, n);
+    if (result == NULL)
+        goto error;
+    range_filter_i64((const int64_t *)begins.buf, (const int64_t *)ends.buf,
+                     (size_t)n, (int64_t)qb, (int64_t)qe,
+                     (uint8_t *)PyBytes_AS_STRING(result));
+    PyBuffer_Release(&begins);
+    PyBuffer_Release(&ends);
+    return result;
+
+error:
+    PyBuffer_Release(&begins);
+    PyBuffer_Release(&ends);
+    return NULL;
+}
+
+static PyMethodDef simd_filter_methods[] = {
+    {"range_filter_i64", py_range_filter_i64, METH_VARARGS,
+     "range_filter_i64(begins, ends, q_begin, q_end) -> bytes\n\n"
+     "Tests each interval in the parallel int64 endpoint buffers for\n"
+     "overlap with [q_begin, q_end). Returns one byte per interval,\n"
+     "1 where the interval overlaps the query range."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef simd_filter_module = {
+    PyModuleDef_HEAD_INIT,
+    "intervaltree._simd_filter",
+    "Optional SIMD range-filter kernel over int64 endpoint arrays.",
+    -1,
+    simd_filter_methods
+};
+
+PyMODINIT_FUNC
+PyInit__simd_filter(void)
+{
+    range_filter_init();
+    return PyModule_Create(&simd_filter_module);
+}
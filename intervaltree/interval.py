@@ -23,16 +23,114 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from numbers import Number
-from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only the batch kernels need it
+    np = None
+
+try:
+    # Compiled SIMD kernel over parallel int64 endpoint buffers; built
+    # only when a C compiler was available at install time.
+    from ._simd_filter import range_filter_i64
+except ImportError:
+    range_filter_i64 = None
+
+
+def overlaps_batch(begins, ends, q_begin, q_end, out=None):
+    """
+    Vectorized version of Interval.overlaps() for a range query against
+    many intervals at once. The endpoints are given as parallel arrays
+    (structure-of-arrays layout), so the two comparisons run as numpy
+    ufuncs instead of one Python-level call per interval.
+
+    Requires numpy.
+    :param begins: array-like of interval begins
+    :param ends: array-like of interval ends, parallel to begins
+    :param q_begin: beginning point of the query range
+    :param q_end: end point of the query range
+    :param out: optional preallocated bool array to write the mask into
+    :return: boolean mask, True where the interval overlaps the range
+    :rtype: numpy.ndarray of bool
+    """
+    if np is None:
+        raise ImportError("numpy is required for overlaps_batch()")
+    begins = np.asarray(begins)
+    ends = np.asarray(ends)
+    if out is None:
+        out = np.empty(begins.shape, dtype=bool)
+    np.less(q_begin, ends, out=out)
+    np.logical_and(out, np.greater(q_end, begins), out=out)
+    return out
+
+
+# Caches, per endpoint type, whether endpoints format via str() in repr.
+_NUMERIC_TYPE_CACHE = {}
+
+# Caches type names for the unsortable-data tiebreak in _cmp_data; in
+# mixed-data trees that branch fires on every other compare.
+_TYPE_NAME_CACHE = {}
+
+
+def _type_name(t):
+    """
+    Cached type(...).__name__ lookup.
+    :param t: a type
+    :return: the type's name
+    :rtype: str
+    """
+    name = _TYPE_NAME_CACHE.get(t)
+    if name is None:
+        name = _TYPE_NAME_CACHE.setdefault(t, t.__name__)
+    return name
 
 
 # noinspection PyBroadException
-class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
-    __slots__ = ()  # Saves memory, avoiding the need to create __dict__ for each interval
+class Interval(object):
+    # Plain slots instead of a namedtuple base: attribute reads skip the
+    # itemgetter descriptors and construction skips tuple.__new__, both of
+    # which showed up on the overlaps/contains_point hot paths.
+    __slots__ = ('begin', 'end', 'data', '_hash', '_is_null')
+
+    def __new__(cls, begin, end, data=None, _new=object.__new__):
+        # Intervals without data are common enough to deserve their own
+        # subclass, which skips the data compare in __eq__. User
+        # subclasses construct normally. _new binds object.__new__ as a
+        # local, saving a global and an attribute lookup per
+        # construction in bulk load paths.
+        if data is None and cls is Interval:
+            return _new(_NullDataInterval)
+        return _new(cls)
+
+    def __init__(self, begin, end, data=None, _set=object.__setattr__):
+        _set(self, 'begin', begin)
+        _set(self, 'end', end)
+        _set(self, 'data', data)
+        # Intervals are immutable, so the hash and the nullness test
+        # can be computed once up front instead of on every set/dict
+        # lookup and ordered comparison.
+        _set(self, '_hash', hash((begin, end)))
+        _set(self, '_is_null', begin >= end)
+
+    def __setattr__(self, name, value):
+        """
+        Intervals are immutable: the cached hash and nullness, and the
+        tree's set-based storage, all depend on the fields never
+        changing after construction.
+        :raises AttributeError: always
+        """
+        raise AttributeError(
+            "can't set attribute: Interval objects are immutable")
+
+    def __delattr__(self, name):
+        """
+        Intervals are immutable. See __setattr__().
+        :raises AttributeError: always
+        """
+        raise AttributeError(
+            "can't delete attribute: Interval objects are immutable")
+
 
-    def __new__(cls, begin, end, data=None):
-        return super(Interval, cls).__new__(cls, begin, end, data)
-    
     def overlaps(self, begin, end=None):
         """
         Whether the interval overlaps the given point, range or Interval.
@@ -48,10 +146,10 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
             #   self.begin <= C < self.end
             # See https://stackoverflow.com/questions/3269434/whats-the-most-efficient-way-to-test-two-integer-ranges-for-overlap/3269471#3269471
             return begin < self.end and end > self.begin
-        try:
-            return self.overlaps(begin.begin, begin.end)
-        except:
-            return self.contains_point(begin)
+        if isinstance(begin, Interval) or (
+                hasattr(begin, 'begin') and hasattr(begin, 'end')):
+            return begin.begin < self.end and begin.end > self.begin
+        return self.begin <= begin < self.end
 
     def overlap_size(self, begin, end=None):
         """
@@ -62,19 +160,23 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :rtype: depends on the given input (e.g., int will be returned for int interval and timedelta for
         datetime intervals)
         """
-        overlaps = self.overlaps(begin, end)
-        if not overlaps:
-            return 0
-
         if end is not None:
             # case end is given
-            i0 = max(self.begin, begin)
-            i1 = min(self.end, end)
+            b, e = begin, end
+        elif isinstance(begin, Interval) or (
+                hasattr(begin, 'begin') and hasattr(begin, 'end')):
+            b, e = begin.begin, begin.end
+        else:
+            # a bare point has no extent
+            return 0
+        # the intersection bounds decide both the overlap test and the
+        # size, so compute them once; conditional expressions beat the
+        # max()/min() builtins for two scalars
+        i0 = self.begin if self.begin > b else b
+        i1 = self.end if self.end < e else e
+        if i1 > i0:
             return i1 - i0
-        # assume the type is interval, in other cases, an exception will be thrown
-        i0 = max(self.begin, begin.begin)
-        i1 = min(self.end, begin.end)
-        return i1 - i0
+        return 0
 
     def contains_point(self, p):
         """
@@ -84,7 +186,18 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :rtype: bool
         """
         return self.begin <= p < self.end
-    
+
+    def __contains__(self, p):
+        """
+        Whether the Interval contains p, so that `p in interval` works.
+        The operator form dispatches through the C-level slot without a
+        bound-method lookup, which matters in the tree's descent loops.
+        :param p: a point
+        :return: True or False
+        :rtype: bool
+        """
+        return self.begin <= p < self.end
+
     def range_matches(self, other):
         """
         Whether the begins equal and the ends equal. Compare __eq__().
@@ -119,16 +232,16 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         """
         if self.overlaps(other):
             return 0
-        try:
+        if isinstance(other, Interval) or (
+                hasattr(other, 'begin') and hasattr(other, 'end')):
             if self.begin < other.begin:
                 return other.begin - self.end
             else:
                 return self.begin - other.end
-        except:
-            if self.end <= other:
-                return other - self.end
-            else:
-                return self.begin - other
+        if self.end <= other:
+            return other - self.end
+        else:
+            return self.begin - other
 
     def is_null(self):
         """
@@ -136,7 +249,7 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :return: True if end <= begin else False
         :rtype: bool
         """
-        return self.begin >= self.end
+        return self._is_null
 
     def length(self):
         """
@@ -148,13 +261,38 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
             return 0
         return self.end - self.begin
 
+    def __len__(self):
+        """
+        Number of fields, as when unpacking a tuple.
+        :return: 3
+        :rtype: int
+        """
+        return 3
+
+    def __iter__(self):
+        """
+        Iterates over the fields, so that tuple unpacking works.
+        :return: iterator over (begin, end, data)
+        :rtype: iterator
+        """
+        return iter((self.begin, self.end, self.data))
+
+    def __getitem__(self, index):
+        """
+        Indexes and slices the fields as if this were the tuple
+        (begin, end, data).
+        :param index: int or slice
+        :return: field or tuple of fields
+        """
+        return (self.begin, self.end, self.data)[index]
+
     def __hash__(self):
         """
         Depends on begin and end only.
         :return: hash
         :rtype: Number
         """
-        return hash((self.begin, self.end))
+        return self._hash
 
     def __eq__(self, other):
         """
@@ -170,12 +308,10 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
             self.data == other.data
         )
 
-    def __cmp__(self, other):
+    def _cmp_data(self, other):
         """
-        Tells whether other sorts before, after or equal to this
-        Interval.
-
-        Sorting is by begins, then by ends, then by data fields.
+        Tells whether other's data field sorts before, after or equal
+        to this Interval's. Used by __cmp__() when begins and ends tie.
 
         If data fields are not both sortable types, data fields are
         compared alphabetically by type name.
@@ -183,24 +319,45 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :return: -1, 0, 1
         :rtype: int
         """
-        s = self[0:2]
-        try:
-            o = other[0:2]
-        except:
-            o = (other,)
-        if s != o:
-            return -1 if s < o else 1
         try:
             if self.data == other.data:
                 return 0
             return -1 if self.data < other.data else 1
         except TypeError:
-            s = type(self.data).__name__
-            o = type(other.data).__name__
+            s = _type_name(type(self.data))
+            o = _type_name(type(other.data))
             if s == o:
                 return 0
             return -1 if s < o else 1
 
+    def __cmp__(self, other):
+        """
+        Tells whether other sorts before, after or equal to this
+        Interval.
+
+        Sorting is by begins, then by ends, then by data fields.
+
+        If data fields are not both sortable types, data fields are
+        compared alphabetically by type name.
+        :param other: Interval or point
+        :return: -1, 0, 1
+        :rtype: int
+        """
+        if isinstance(other, Interval):
+            if self.begin != other.begin:
+                return -1 if self.begin < other.begin else 1
+            if self.end != other.end:
+                return -1 if self.end < other.end else 1
+            return self._cmp_data(other)
+        if isinstance(other, tuple):  # plain (begin, end, ...) tuple
+            s = (self.begin, self.end)
+            o = other[0:2]
+            if s != o:
+                return -1 if s < o else 1
+            return self._cmp_data(other)
+        # other is a point; a point ties with begin but sorts before end
+        return -1 if self.begin < other else 1
+
     def __lt__(self, other):
         """
         Less than operator. Parrots __cmp__()
@@ -208,8 +365,29 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :return: True or False
         :rtype: bool
         """
+        if isinstance(other, Interval):
+            if self.begin != other.begin:
+                return self.begin < other.begin
+            if self.end != other.end:
+                return self.end < other.end
+            return self._cmp_data(other) < 0
         return self.__cmp__(other) < 0
 
+    def __le__(self, other):
+        """
+        Less than or equal operator. Parrots __cmp__()
+        :param other: Interval or point
+        :return: True or False
+        :rtype: bool
+        """
+        if isinstance(other, Interval):
+            if self.begin != other.begin:
+                return self.begin < other.begin
+            if self.end != other.end:
+                return self.end < other.end
+            return self._cmp_data(other) <= 0
+        return self.__cmp__(other) <= 0
+
     def __gt__(self, other):
         """
         Greater than operator. Parrots __cmp__()
@@ -217,15 +395,39 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :return: True or False
         :rtype: bool
         """
+        if isinstance(other, Interval):
+            if self.begin != other.begin:
+                return self.begin > other.begin
+            if self.end != other.end:
+                return self.end > other.end
+            return self._cmp_data(other) > 0
         return self.__cmp__(other) > 0
 
+    def __ge__(self, other):
+        """
+        Greater than or equal operator. Parrots __cmp__()
+        :param other: Interval or point
+        :return: True or False
+        :rtype: bool
+        """
+        if isinstance(other, Interval):
+            if self.begin != other.begin:
+                return self.begin > other.begin
+            if self.end != other.end:
+                return self.end > other.end
+            return self._cmp_data(other) >= 0
+        return self.__cmp__(other) >= 0
+
     def _raise_if_null(self, other):
         """
         :raises ValueError: if either self or other is a null Interval
         """
-        if self.is_null():
+        if self._is_null:
             raise ValueError("Cannot compare null Intervals!")
-        if hasattr(other, 'is_null') and other.is_null():
+        if isinstance(other, Interval):
+            if other._is_null:
+                raise ValueError("Cannot compare null Intervals!")
+        elif hasattr(other, 'is_null') and other.is_null():
             raise ValueError("Cannot compare null Intervals!")
 
     def lt(self, other):
@@ -237,8 +439,13 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :return: True or False
         :rtype: bool
         """
-        self._raise_if_null(other)
-        return self.end <= getattr(other, 'begin', other)
+        if self._is_null:
+            raise ValueError("Cannot compare null Intervals!")
+        if isinstance(other, Interval):
+            if other._is_null:
+                raise ValueError("Cannot compare null Intervals!")
+            return self.end <= other.begin
+        return self.end <= other
 
     def le(self, other):
         """
@@ -249,8 +456,13 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :return: True or False
         :rtype: bool
         """
-        self._raise_if_null(other)
-        return self.end <= getattr(other, 'end', other)
+        if self._is_null:
+            raise ValueError("Cannot compare null Intervals!")
+        if isinstance(other, Interval):
+            if other._is_null:
+                raise ValueError("Cannot compare null Intervals!")
+            return self.end <= other.end
+        return self.end <= other
 
     def gt(self, other):
         """
@@ -261,11 +473,13 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :return: True or False
         :rtype: bool
         """
-        self._raise_if_null(other)
-        if hasattr(other, 'end'):
+        if self._is_null:
+            raise ValueError("Cannot compare null Intervals!")
+        if isinstance(other, Interval):
+            if other._is_null:
+                raise ValueError("Cannot compare null Intervals!")
             return self.begin >= other.end
-        else:
-            return self.begin > other
+        return self.begin > other
 
     def ge(self, other):
         """
@@ -276,8 +490,13 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :return: True or False
         :rtype: bool
         """
-        self._raise_if_null(other)
-        return self.begin >= getattr(other, 'begin', other)
+        if self._is_null:
+            raise ValueError("Cannot compare null Intervals!")
+        if isinstance(other, Interval):
+            if other._is_null:
+                raise ValueError("Cannot compare null Intervals!")
+            return self.begin >= other.begin
+        return self.begin >= other
 
     def _get_fields(self):
         """
@@ -292,18 +511,30 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         else:
             return self.begin, self.end
     
+    def _repr_endpoints(self):
+        """
+        String forms of begin and end: str() for numbers, repr()
+        otherwise. The Number check goes through ABC machinery, so its
+        result is cached per endpoint type.
+        :return: begin and end, formatted
+        :rtype: tuple of str
+        """
+        t = type(self.begin)
+        is_num = _NUMERIC_TYPE_CACHE.get(t)
+        if is_num is None:
+            is_num = _NUMERIC_TYPE_CACHE.setdefault(
+                t, isinstance(self.begin, Number))
+        if is_num:
+            return str(self.begin), str(self.end)
+        return repr(self.begin), repr(self.end)
+
     def __repr__(self):
         """
         Executable string representation of this Interval.
         :return: string representation
         :rtype: str
         """
-        if isinstance(self.begin, Number):
-            s_begin = str(self.begin)
-            s_end = str(self.end)
-        else:
-            s_begin = repr(self.begin)
-            s_end = repr(self.end)
+        s_begin, s_end = self._repr_endpoints()
         if self.data is None:
             return "Interval({0}, {1})".format(s_begin, s_end)
         else:
@@ -325,4 +556,59 @@ class Interval(namedtuple('IntervalBase', ['begin', 'end', 'data'])):
         :return: pickle data
         :rtype: tuple
         """
-        return Interval, self._get_fields()
+        return _fast_interval, (self.begin, self.end, self.data)
+
+
+def _fast_interval(begin, end, data=None):
+    """
+    Reconstructor for __reduce__. Unconditionally passing all three
+    fields keeps the pickle path free of the _get_fields None branch;
+    None itself is cheap to pickle.
+    :return: Interval
+    :rtype: Interval
+    """
+    return Interval(begin, end, data)
+
+
+class _NullDataInterval(Interval):
+    """
+    Specialized Interval for the common data=None case. Constructed
+    automatically by Interval.__new__; not part of the public API.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        """
+        Both data fields are known to be None when comparing two
+        intervals of this class, so only begins and ends are checked.
+        :param other: Interval
+        :return: True or False
+        :rtype: bool
+        """
+        if isinstance(other, _NullDataInterval):
+            return self.begin == other.begin and self.end == other.end
+        return Interval.__eq__(self, other)
+
+    __hash__ = Interval.__hash__
+
+    def _get_fields(self):
+        """
+        Used by str, unicode, repr and __reduce__.
+
+        Returns only the fields necessary to reconstruct the Interval.
+        :return: reconstruction info
+        :rtype: tuple
+        """
+        return self.begin, self.end
+
+    def __repr__(self):
+        """
+        Executable string representation of this Interval. The data
+        field is known to be None, so no branch is needed.
+        :return: string representation
+        :rtype: str
+        """
+        s_begin, s_end = self._repr_endpoints()
+        return "Interval({0}, {1})".format(s_begin, s_end)
+
+    __str__ = __repr__
@@ -0,0 +1,92 @@
+"""
+intervaltree: A mutable, self-balancing interval tree for Python 2 and 3.
+Queries may be by point, by range overlap, or by range envelopment.
+
+Type stubs for the Interval class. Kept in a stub file so the runtime
+module carries no typing imports, generic subscriptions or Protocol
+classes, all of which cost time at import and construction.
+
+Copyright 2013-2018 Chaim Leib Halbert
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from typing import (
+    Any,
+    Generic,
+    Iterator,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+
+_C = TypeVar('_C', bound=Comparable)
+_A = TypeVar('_A')
+
+def overlaps_batch(
+    begins: Any,
+    ends: Any,
+    q_begin: Any,
+    q_end: Any,
+    out: Optional[Any] = ...,
+) -> Any: ...
+
+range_filter_i64: Optional[Any]
+
+class Interval(Generic[_C, _A]):
+    begin: _C
+    end: _C
+    data: _A
+    def __init__(self, begin: _C, end: _C, data: _A = ...) -> None: ...
+    def overlaps(
+        self,
+        begin: Union[_C, Interval[_C, Any]],
+        end: Optional[_C] = ...,
+    ) -> bool: ...
+    def overlap_size(
+        self,
+        begin: Union[_C, Interval[_C, Any]],
+        end: Optional[_C] = ...,
+    ) -> Any: ...
+    def contains_point(self, p: _C) -> bool: ...
+    def __contains__(self, p: Any) -> bool: ...
+    def range_matches(self, other: Interval[_C, Any]) -> bool: ...
+    def contains_interval(self, other: Interval[_C, Any]) -> bool: ...
+    def distance_to(self, other: Union[_C, Interval[_C, Any]]) -> Any: ...
+    def is_null(self) -> bool: ...
+    def length(self) -> Any: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def __getitem__(self, index: Any) -> Any: ...
+    def __hash__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def _cmp_data(self, other: Interval[_C, Any]) -> int: ...
+    def __cmp__(self, other: Union[_C, Interval[_C, Any]]) -> int: ...
+    def __lt__(self, other: Union[_C, Interval[_C, Any]]) -> bool: ...
+    def __le__(self, other: Union[_C, Interval[_C, Any]]) -> bool: ...
+    def __gt__(self, other: Union[_C, Interval[_C, Any]]) -> bool: ...
+    def __ge__(self, other: Union[_C, Interval[_C, Any]]) -> bool: ...
+    def _raise_if_null(self, other: Union[_C, Interval[_C, Any]]) -> None: ...
+    def lt(self, other: Union[_C, Interval[_C, Any]]) -> bool: ...
+    def le(self, other: Union[_C, Interval[_C, Any]]) -> bool: ...
+    def gt(self, other: Union[_C, Interval[_C, Any]]) -> bool: ...
+    def ge(self, other: Union[_C, Interval[_C, Any]]) -> bool: ...
+    def _get_fields(self) -> Tuple[Any, ...]: ...
+    def __repr__(self) -> str: ...
+    def __str__(self) -> str: ...
+    def copy(self) -> Interval[_C, _A]: ...
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]: ...
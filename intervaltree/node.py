@@ -105,7 +105,7 @@ class Node(object):
 
     def center_hit(self, interval):
         """Returns whether interval overlaps self.x_center."""
-        return interval.contains_point(self.x_center)
+        return self.x_center in interval
 
     def hit_branch(self, interval):
         """
@@ -389,7 +389,7 @@ class Node(object):
                 new_x_center = max(new_x_center, next_max_iv.end)
             def get_new_s_center():
                 for iv in self.s_center:
-                    if iv.contains_point(new_x_center): yield iv
+                    if new_x_center in iv: yield iv
 
             # Create a new node with the largest x_center possible.
             child = Node(new_x_center, get_new_s_center())
@@ -416,7 +416,7 @@ class Node(object):
 
             # Move any overlaps into greatest_child
             for iv in set(self.s_center):
-                if iv.contains_point(greatest_child.x_center):
+                if greatest_child.x_center in iv:
                     self.s_center.remove(iv)
                     greatest_child.add(iv)
 
@@ -444,7 +444,7 @@ class Node(object):
         Returns whether this node or a child overlaps p.
         """
         for iv in self.s_center:
-            if iv.contains_point(p):
+            if p in iv:
                 return True
         branch = self[p > self.x_center]
         return branch and branch.contains_point(p)
@@ -489,7 +489,7 @@ class Node(object):
             assert iv.begin < iv.end
             assert iv.overlaps(self.x_center)
             for parent in sorted(parents):
-                assert not iv.contains_point(parent), \
+                assert parent not in iv, \
                     "Error: Overlaps ancestor ({})! \n{}\n\n{}".format(
                         parent, iv, self.print_structure(tostring=True)
                     )
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+intervaltree: A mutable, self-balancing interval tree for Python 2 and 3.
+Queries may be by point, by range overlap, or by range envelopment.
+
+IntervalStore: a read-only structure-of-arrays snapshot of intervals.
+
+The tree proper stores one Interval object per entry, which is the
+right shape for a mutable, self-balancing structure but chases a
+pointer per visit when scanning. An IntervalStore holds the same
+intervals as two contiguous endpoint columns plus a data list, so bulk
+queries run as vectorized kernels over the columns and individual
+Intervals are materialized only on demand.
+
+Requires numpy.
+
+Copyright 2013-2018 Chaim Leib Halbert
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from . import _numba_kernels
+from .interval import Interval, overlaps_batch, np
+
+
+class IntervalStore(object):
+    """
+    An immutable snapshot of a set of intervals in structure-of-arrays
+    layout: parallel begin/end columns and an optional data list,
+    sorted in Interval order. Build one from an IntervalTree when a
+    batch of range or point queries is coming, then query the columns
+    instead of descending the tree per query::
+
+        store = IntervalStore.from_tree(tree)
+        mask = store.overlaps(5, 15)
+        hits = [store[i] for i in mask.nonzero()[0]]
+    """
+    __slots__ = ('begins', 'ends', 'data')
+
+    def __init__(self, begins, ends, data=None):
+        """
+        Set up a store from parallel begin/end columns and an optional
+        parallel data sequence. The columns are not re-sorted; use
+        from_intervals() or from_tree() to get canonical ordering.
+        """
+        if np is None:
+            raise ImportError("numpy is required for IntervalStore")
+        self.begins = np.asarray(begins)
+        self.ends = np.asarray(ends)
+        if self.begins.shape != self.ends.shape:
+            raise ValueError(
+                "IntervalStore: begins and ends must have the same length")
+        self.data = list(data) if data is not None else None
+        if self.data is not None and len(self.data) != len(self.begins):
+            raise ValueError(
+                "IntervalStore: data must parallel begins and ends")
+
+    @classmethod
+    def from_intervals(cls, intervals, dtype=None):
+        """
+        Create a new IntervalStore from an iterable of Intervals,
+        sorted in Interval order. Pass dtype to narrow the endpoint
+        columns (e.g. numpy.int32 halves the bytes scanned per query).
+        """
+        ivs = sorted(intervals)
+        begins = np.array([iv.begin for iv in ivs], dtype=dtype)
+        ends = np.array([iv.end for iv in ivs], dtype=dtype)
+        data = [iv.data for iv in ivs]
+        if all(d is None for d in data):
+            data = None
+        return cls(begins, ends, data)
+
+    @classmethod
+    def from_tree(cls, tree, dtype=None):
+        """
+        Create a new IntervalStore snapshotting the given IntervalTree.
+        Later mutations of the tree are not reflected in the store.
+        """
+        return cls.from_intervals(tree, dtype=dtype)
+
+    def __len__(self):
+        return len(self.begins)
+
+    def __getitem__(self, index):
+        """
+        Materializes the Interval at the given row.
+        :rtype: Interval
+        """
+        data = self.data[index] if self.data is not None else None
+        # .item() unboxes numpy scalars to plain Python numbers
+        return Interval(self.begins[index].item(),
+                        self.ends[index].item(),
+                        data)
+
+    def __iter__(self):
+        for i in range(len(self.begins)):
+            yield self[i]
+
+    def overlaps(self, q_begin, q_end, out=None):
+        """
+        Boolean mask of the intervals overlapping the given range.
+        :rtype: numpy.ndarray of bool
+        """
+        return overlaps_batch(self.begins, self.ends, q_begin, q_end, out)
+
+    def contains_point(self, p, out=None):
+        """
+        Boolean mask of the intervals containing the given point.
+        :rtype: numpy.ndarray of bool
+        """
+        if out is None:
+            out = np.empty(self.begins.shape, dtype=bool)
+        np.less_equal(self.begins, p, out=out)
+        np.logical_and(out, np.greater(self.ends, p), out=out)
+        return out
+
+    def overlap_sizes(self, q_begin, q_end, out=None):
+        """
+        Overlap size of each interval with the given range, 0 where
+        there is no overlap.
+        :rtype: numpy.ndarray
+        """
+        if out is None:
+            out = np.empty(self.begins.shape, dtype=self.begins.dtype)
+        if _numba_kernels.njit is not None:
+            return _numba_kernels.overlap_sizes(
+                self.begins, self.ends, q_begin, q_end, out)
+        np.minimum(self.ends, q_end, out=out)
+        out -= np.maximum(self.begins, q_begin)
+        np.maximum(out, 0, out=out)
+        return out
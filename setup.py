@@ -29,8 +29,9 @@ import io
 import os
 import sys
 from sys import exit
-from setuptools import setup
+from setuptools import setup, Extension
 from setuptools.command.test import test as TestCommand
+from setuptools.command.build_ext import build_ext
 import subprocess
 
 ## CONFIG
@@ -83,6 +84,42 @@ isPy2 = version.major == 2
 isPy3 = version.major == 3
 isPy36 = isPy3 and version.minor == 6
 
+## Optional C accelerators
+# The typed Interval classes in intervaltree/_cinterval.pyx are built only
+# when Cython is available; the pure-Python package works without them.
+# cythonize raises ValueError (not ImportError) when the .pyx is missing,
+# so check for the file instead of relying on the except clause.
+ext_modules = []
+if os.path.exists('intervaltree/_cinterval.pyx'):
+    try:
+        from Cython.Build import cythonize
+        ext_modules = cythonize(['intervaltree/_cinterval.pyx'])
+    except ImportError:
+        pass
+
+# The SIMD range filter needs only a C compiler; build_ext below skips it
+# quietly if compilation fails, since it too is optional.
+ext_modules.append(
+    Extension('intervaltree._simd_filter', ['intervaltree/_simd_filter.c']))
+
+
+class optional_build_ext(build_ext):
+    """
+    Builds the optional C accelerators, skipping any that fail to
+    compile instead of aborting the install.
+    """
+    def run(self):
+        try:
+            build_ext.run(self)
+        except Exception as e:
+            print("Skipping C accelerators: {0}".format(e))
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except Exception as e:
+            print("Skipping {0}: {1}".format(ext.name, e))
+
 ## Run setuptools
 setup(
     name='intervaltree',
@@ -123,6 +160,8 @@ setup(
     download_url='https://github.com/chaimleib/intervaltree/tarball/{version}'.format(**vinfo),
     license="Apache License, Version 2.0",
     packages=["intervaltree"],
+    package_data={"intervaltree": ["py.typed", "*.pyi"]},
+    ext_modules=ext_modules,
     include_package_data=True,
     zip_safe=True,
     tests_require=[
@@ -152,5 +191,5 @@ setup(
             else ' < 7.1' if isPy36
             else ''),
     ],
-    cmdclass={'test': PyTest}
+    cmdclass={'test': PyTest, 'build_ext': optional_build_ext}
 )
@@ -0,0 +1,124 @@
+"""
+intervaltree: A mutable, self-balancing interval tree for Python 2 and 3.
+Queries may be by point, by range overlap, or by range envelopment.
+
+Test module: Intervals, vectorized batch kernels
+
+Copyright 2013-2018 Chaim Leib Halbert
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from intervaltree import Interval
+from intervaltree.interval import overlaps_batch
+import pytest
+import warnings
+
+np = pytest.importorskip('numpy')
+
+
+ranges = [
+    (-10, -5),
+    (-10, 0),
+    (-10, 5),
+    (-10, 10),
+    (-10, 20),
+    (0, 20),
+    (5, 20),
+    (10, 20),
+    (15, 20),
+]
+
+
+def test_overlaps_batch_matches_overlaps():
+    begins = np.array([b for b, e in ranges])
+    ends = np.array([e for b, e in ranges])
+
+    for qb, qe in [(0, 10), (-20, -15), (20, 30), (-5, 5)]:
+        mask = overlaps_batch(begins, ends, qb, qe)
+        expected = [Interval(b, e).overlaps(qb, qe) for b, e in ranges]
+        assert mask.dtype == np.bool_
+        assert list(mask) == expected
+
+
+def test_overlaps_batch_out_parameter():
+    begins = np.array([b for b, e in ranges])
+    ends = np.array([e for b, e in ranges])
+    out = np.empty(len(ranges), dtype=bool)
+
+    result = overlaps_batch(begins, ends, 0, 10, out=out)
+    assert result is out
+    assert list(out) == [Interval(b, e).overlaps(0, 10) for b, e in ranges]
+
+
+def test_overlaps_batch_empty():
+    mask = overlaps_batch(np.array([]), np.array([]), 0, 10)
+    assert len(mask) == 0
+
+
+def test_range_filter_i64():
+    simd = pytest.importorskip('intervaltree._simd_filter')
+    from array import array
+
+    begins = array('q', [b for b, e in ranges])
+    ends = array('q', [e for b, e in ranges])
+    for qb, qe in [(0, 10), (-20, -15), (20, 30), (-5, 5)]:
+        mask = simd.range_filter_i64(begins, ends, qb, qe)
+        expected = bytes(
+            1 if Interval(b, e).overlaps(qb, qe) else 0 for b, e in ranges)
+        assert mask == expected
+
+    # sizes around the vector width exercise the tail handling
+    for n in range(0, 9):
+        bs = array('q', range(n))
+        es = array('q', [b + 2 for b in range(n)])
+        mask = simd.range_filter_i64(bs, es, 1, 3)
+        expected = bytes(
+            1 if Interval(b, e).overlaps(1, 3) else 0 for b, e in zip(bs, es))
+        assert mask == expected
+
+    with pytest.raises(ValueError):
+        simd.range_filter_i64(array('q', [0]), array('q', [1, 2]), 0, 1)
+
+
+def test_overlap_sizes_kernel():
+    from intervaltree._numba_kernels import overlap_sizes
+    begins = np.array([b for b, e in ranges])
+    ends = np.array([e for b, e in ranges])
+    out = np.empty(len(ranges), dtype=begins.dtype)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # fallback warns if numba is missing
+        for qb, qe in [(0, 10), (-20, -15), (20, 30), (-5, 5)]:
+            result = overlap_sizes(begins, ends, qb, qe, out)
+            expected = [Interval(b, e).overlap_size(qb, qe) for b, e in ranges]
+            assert list(result) == expected
+
+
+def test_contains_points_kernel():
+    from intervaltree._numba_kernels import contains_points
+    begins = np.array([b for b, e in ranges])
+    ends = np.array([e for b, e in ranges])
+    out = np.empty(len(ranges), dtype=bool)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # fallback warns if numba is missing
+        for p in [-15, -10, 0, 5, 10, 20]:
+            result = contains_points(begins, ends, p, out)
+            expected = [Interval(b, e).contains_point(p) for b, e in ranges]
+            assert list(result) == expected
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, '-v'])
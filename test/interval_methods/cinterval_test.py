@@ -0,0 +1,138 @@
+"""
+intervaltree: A mutable, self-balancing interval tree for Python 2 and 3.
+Queries may be by point, by range overlap, or by range envelopment.
+
+Test module: optional Cython typed Interval classes
+
+Copyright 2013-2018 Chaim Leib Halbert
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from intervaltree import Interval
+import itertools
+import pickle
+import pytest
+
+cinterval = pytest.importorskip('intervaltree._cinterval')
+
+
+ranges = [
+    (-10, -5),
+    (-10, 0),
+    (-10, 5),
+    (-10, 10),
+    (-10, 20),
+    (0, 20),
+    (5, 20),
+    (10, 20),
+    (15, 20),
+]
+
+
+@pytest.fixture(params=['IntervalI64', 'IntervalF64'])
+def cls(request):
+    return getattr(cinterval, request.param)
+
+
+def test_fields(cls):
+    iv = cls(0, 10, 'data')
+    assert iv.begin == 0
+    assert iv.end == 10
+    assert iv.data == 'data'
+    assert cls(0, 10).data is None
+
+
+def test_overlaps(cls):
+    iv0 = cls(0, 10)
+    for b, e in ranges:
+        expected = Interval(0, 10).overlaps(b, e)
+        assert iv0.overlaps_range(b, e) == expected
+        assert iv0.overlaps(b, e) == expected
+        assert iv0.overlaps(cls(b, e)) == expected
+        assert iv0.overlaps(Interval(b, e)) == expected
+
+    for p in [-5, 0, 5, 10, 15]:
+        assert iv0.overlaps(p) == Interval(0, 10).overlaps(p)
+
+
+def test_contains_point(cls):
+    iv = cls(0, 10)
+    for p in [-5, 0, 5, 10, 15]:
+        assert iv.contains_point(p) == Interval(0, 10).contains_point(p)
+
+
+def test_overlap_size(cls):
+    iv0 = cls(0, 10)
+    for b, e in ranges:
+        expected = Interval(0, 10).overlap_size(b, e)
+        assert iv0.overlap_size(b, e) == expected
+        assert iv0.overlap_size(cls(b, e)) == expected
+
+
+def test_is_null_and_length(cls):
+    assert cls(0, 0).is_null()
+    assert cls(1, 0).is_null()
+    assert not cls(0, 1).is_null()
+    assert cls(0, 10).length() == 10
+    assert cls(1, 0).length() == 0
+
+
+def test_richcmp(cls):
+    iv0 = cls(0, 10)
+    assert iv0 == cls(0, 10)
+    assert iv0 != cls(0, 10, 'x')
+    assert hash(iv0) == hash(Interval(0, 10))
+
+    for b, e in ranges:
+        other = cls(b, e)
+        expected = Interval(0, 10).__cmp__(Interval(b, e))
+        assert (iv0 < other) == (expected < 0)
+        assert (iv0 <= other) == (expected <= 0)
+        assert (iv0 > other) == (expected > 0)
+        assert (iv0 >= other) == (expected >= 0)
+        assert (iv0 == other) == (expected == 0)
+
+    # data tiebreak, sortable and unsortable
+    assert cls(0, 10, 'a') < cls(0, 10, 'b')
+    assert cls(0, 10, 1) < cls(0, 10, 'x')  # compared by type name
+
+
+def test_sort(cls):
+    ivs = [cls(b, e) for b, e in ranges]
+    expected = [
+        (iv.begin, iv.end)
+        for iv in sorted(Interval(b, e) for b, e in ranges)
+    ]
+    assert [(iv.begin, iv.end) for iv in sorted(ivs)] == expected
+
+
+def test_pickle(cls):
+    for iv in [cls(0, 10), cls(-5, 5, 'data')]:
+        iv2 = pickle.loads(pickle.dumps(iv))
+        assert iv2 == iv
+        assert iv2.data == iv.data
+
+
+def test_branchless_overlaps_range():
+    pts = range(-4, 5)
+    for b, e in itertools.combinations(pts, 2):
+        iv = cinterval.IntervalI64(b, e)
+        for qb, qe in itertools.product(pts, repeat=2):
+            assert iv.overlaps_range_branchless(qb, qe) == \
+                iv.overlaps_range(qb, qe)
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, '-v'])
@@ -266,6 +266,24 @@ def test_interval_int_cmp():
     assert iv.__cmp__(15) == -1
 
 
+def test_interval_le_ge_operators():
+    """
+    Test comparisons with other Intervals using <= and >=
+    """
+    iv0 = Interval(0, 10)
+    iv1 = Interval(0, 10)
+    iv2 = Interval(0, 20)
+    iv3 = Interval(-5, 10)
+
+    assert iv0 <= iv1 and iv0 >= iv1
+    assert iv0 <= iv2 and not iv0 >= iv2
+    assert iv2 >= iv0 and not iv2 <= iv0
+    assert iv3 <= iv0 and iv0 >= iv3
+
+    assert Interval(0, 10, 'a') <= Interval(0, 10, 'b')
+    assert Interval(0, 10, 'b') >= Interval(0, 10, 'a')
+
+
 def test_interval_sort_interval():
     base = Interval(0, 10)
     ivs = [
@@ -64,6 +64,36 @@ def test_generator_init():
     assert tree.end() == 20
 
 
+def test_from_arrays_init():
+    from array import array
+    tree = IntervalTree.from_arrays(
+        array('l', [-20, -10, 10]),
+        array('l', [-10, 10, 20]),
+    )
+    tree.verify()
+    assert tree.items() == set([
+        Interval(-20, -10),
+        Interval(-10, 10),
+        Interval(10, 20),
+    ])
+
+    tree = IntervalTree.from_arrays([0, 1], [1, 2], ['a', 'b'])
+    tree.verify()
+    assert tree.items() == set([Interval(0, 1, 'a'), Interval(1, 2, 'b')])
+
+
+def test_from_arrays_numpy_init():
+    np = pytest.importorskip('numpy')
+    tree = IntervalTree.from_arrays(
+        np.array([0, 10], dtype=np.int32),
+        np.array([5, 20], dtype=np.int32),
+    )
+    tree.verify()
+    assert tree.items() == set([Interval(0, 5), Interval(10, 20)])
+    # endpoints are unboxed to plain Python ints
+    assert all(type(iv.begin) is int for iv in tree)
+
+
 def test_invalid_interval_init():
     """
     Ensure that begin < end.
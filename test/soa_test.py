@@ -0,0 +1,93 @@
+"""
+intervaltree: A mutable, self-balancing interval tree for Python 2 and 3.
+Queries may be by point, by range overlap, or by range envelopment.
+
+Test module: IntervalStore, structure-of-arrays snapshots
+
+Copyright 2013-2018 Chaim Leib Halbert
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from intervaltree import Interval, IntervalTree, IntervalStore
+import pytest
+import warnings
+
+np = pytest.importorskip('numpy')
+
+
+ivs = [
+    Interval(-10, -5),
+    Interval(-10, 0),
+    Interval(-10, 5, 'a'),
+    Interval(0, 10),
+    Interval(5, 20, 'b'),
+    Interval(15, 20),
+]
+
+
+def test_from_intervals():
+    store = IntervalStore.from_intervals(ivs)
+    assert len(store) == len(ivs)
+    assert list(store) == sorted(ivs)
+    assert store[2] == sorted(ivs)[2]
+    assert type(store[0].begin) is int
+
+
+def test_from_tree():
+    tree = IntervalTree(ivs)
+    store = IntervalStore.from_tree(tree)
+    assert set(store) == tree.items()
+
+
+def test_from_intervals_narrow_dtype():
+    store = IntervalStore.from_intervals(ivs, dtype=np.int32)
+    assert store.begins.dtype == np.int32
+    assert list(store) == sorted(ivs)
+
+
+def test_mismatched_columns():
+    with pytest.raises(ValueError):
+        IntervalStore([0], [1, 2])
+    with pytest.raises(ValueError):
+        IntervalStore([0, 1], [1, 2], ['a'])
+
+
+def test_overlaps():
+    store = IntervalStore.from_intervals(ivs)
+    for qb, qe in [(0, 10), (-20, -15), (20, 30), (-5, 5)]:
+        mask = store.overlaps(qb, qe)
+        assert [bool(m) for m in mask] == \
+            [iv.overlaps(qb, qe) for iv in store]
+
+
+def test_contains_point():
+    store = IntervalStore.from_intervals(ivs)
+    for p in [-15, -10, 0, 5, 10, 20]:
+        mask = store.contains_point(p)
+        assert [bool(m) for m in mask] == \
+            [iv.contains_point(p) for iv in store]
+
+
+def test_overlap_sizes():
+    store = IntervalStore.from_intervals(ivs)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # numba fallback warns once
+        for qb, qe in [(0, 10), (-20, -15), (20, 30), (-5, 5)]:
+            sizes = store.overlap_sizes(qb, qe)
+            assert list(sizes) == [iv.overlap_size(qb, qe) for iv in store]
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, '-v'])